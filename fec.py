@@ -162,7 +162,7 @@ def related(name: str, data: str | None = None):
     """Show all related name sets."""
     data_manager = DataManager(data) if data is not None else DataManager.default()
     nicknames_manager = NicknamesManager.from_data_manager(data_manager)
-    for related_name_set in nicknames_manager.get_related_names(name):
+    for related_name_set in nicknames_manager.get_related_names(name.upper().strip()):
         print(json.dumps(list(related_name_set)))
 
 
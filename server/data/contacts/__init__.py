@@ -6,7 +6,7 @@ from dataclasses import dataclass, replace
 from server.data.phone import get_npa_id
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Contact:
     """A contact in the address book."""
 
@@ -20,6 +20,11 @@ class Contact:
     phone: str | None  # must be in the E164 format
     zip_code: str | None  # Either 5 or 9 digits
 
+    def __post_init__(self):
+        """Store names upper-cased and stripped, so lookups needn't normalize."""
+        object.__setattr__(self, "first_name", self.first_name.upper().strip())
+        object.__setattr__(self, "last_name", self.last_name.upper().strip())
+
     @property
     def zip5(self) -> str | None:
         """Returns the first 5 digits of the zip code, if any."""
@@ -26,7 +26,9 @@ class ABBUManagerBase(abc.ABC, IContactProvider):
     def get_contacts(self) -> t.Iterable[Contact]:
         """Return an iterator of contacts."""
         for abperson in self.get_abpersons():
-            maybe_abperson = self._parse_abperson(abperson)
+            # Close each abperson as soon as it's parsed.
+            with abperson:
+                maybe_abperson = self._parse_abperson(abperson)
             if maybe_abperson:
                 yield maybe_abperson
 
@@ -93,15 +95,22 @@ class ZipABBUManager(ABBUManagerBase):
     zip file that *is* an `abbu` directory.
     """
 
-    _path: pathlib.Path
+    _file: pathlib.Path | t.IO[bytes]
 
-    def __init__(self, path: str | pathlib.Path):
-        """Initialize a new instance of the ZipAddressBookBackupManager class."""
-        self._path = validate_extant_file(pathlib.Path(path))
+    def __init__(self, path: str | pathlib.Path | t.IO[bytes]):
+        """
+        Initialize a new instance of the ZipAddressBookBackupManager class.
+
+        `path` may also be an already-open (seekable) binary file.
+        """
+        if isinstance(path, str | pathlib.Path):
+            self._file = validate_extant_file(pathlib.Path(path))
+        else:
+            self._file = path
 
     def get_abpersons(self) -> t.Iterable[t.IO[bytes]]:
         """Return an iterator of abpersons."""
-        with zipfile.ZipFile(self._path) as zip_file:
+        with zipfile.ZipFile(self._file) as zip_file:
             for info in zip_file.infolist():
                 if (
                     info.filename.endswith("ABPerson.abcdp")
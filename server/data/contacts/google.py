@@ -1,4 +1,6 @@
+import contextlib
 import csv
+import io
 import pathlib
 import typing as t
 import uuid
@@ -15,12 +17,33 @@ class GoogleContactExportManager(IContactProvider):
     Google's CSV export format.
     """
 
-    def __init__(self, path: str | pathlib.Path):
-        self._path = validate_extant_file(pathlib.Path(path))
+    _file: pathlib.Path | t.IO[bytes]
+
+    def __init__(self, path: str | pathlib.Path | t.IO[bytes]):
+        """`path` may also be an already-open (seekable) binary file."""
+        if isinstance(path, str | pathlib.Path):
+            self._file = validate_extant_file(pathlib.Path(path))
+        else:
+            self._file = path
+
+    @contextlib.contextmanager
+    def _open(self) -> t.Iterator[t.TextIO]:
+        """Open the export for reading as text."""
+        if isinstance(self._file, pathlib.Path):
+            with open(self._file) as f:
+                yield f
+            return
+        self._file.seek(0)
+        text_io = io.TextIOWrapper(self._file, newline="")
+        try:
+            yield text_io
+        finally:
+            # Leave the underlying file open; it isn't ours to close.
+            text_io.detach()
 
     def get_contacts(self) -> t.Iterable[Contact]:
         """Return an iterator of contacts."""
-        with open(self._path) as f:
+        with self._open() as f:
             reader = csv.DictReader(f)
             for row in reader:
                 first_name = row["Given Name"].strip().upper() or None
@@ -90,14 +90,35 @@ class RefineContactProvider(ContactProviderWrapper):
         if contact.has_zip:
             zip5 = contact.zip5
             assert zip5
-            for city, state in self._zip_code_provider.get_city_states(zip5):
-                yield contact.with_city_state(city, state)
+            yield from self._with_city_states(
+                contact, self._zip_code_provider.get_city_states(zip5)
+            )
             return
         if contact.has_us_phone:
             npa_id = contact.npa_id
             assert npa_id
-            for area_code in self._area_code_provider.get_area_codes(npa_id):
-                if area_code.city and area_code.state:
-                    yield contact.with_city_state(area_code.city, area_code.state)
+            yield from self._with_city_states(
+                contact,
+                (
+                    (area_code.city, area_code.state)
+                    for area_code in self._area_code_provider.get_area_codes(npa_id)
+                    if area_code.city and area_code.state
+                ),
+            )
             return
         yield contact
+
+    def _with_city_states(
+        self, contact: Contact, city_states: t.Iterable[tuple[str, str]]
+    ) -> t.Iterable[Contact]:
+        """
+        Yield a copy of the contact for each distinct city and state.
+
+        Duplicate alternatives would only cost us extra searches downstream.
+        """
+        seen: set[tuple[str, str]] = set()
+        for city, state in city_states:
+            if (city, state) in seen:
+                continue
+            seen.add((city, state))
+            yield contact.with_city_state(city, state)
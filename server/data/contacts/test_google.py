@@ -0,0 +1,32 @@
+# ruff: noqa: D102
+import io
+import tempfile
+import unittest
+
+from .google import GoogleContactExportManager
+
+EXPORT_CSV = """\
+Given Name,Family Name,Address 1 - City,Address 1 - Region,Address 1 - Postal Code,Phone 1 - Value
+Jane,Doe,Seattle,WA,98101-1234,
+,Nobody,Seattle,WA,98101,
+"""  # noqa: E501
+
+
+class GoogleContactExportManagerTestCase(unittest.TestCase):
+    def test_get_contacts_from_binary_io(self):
+        binary_io = io.BytesIO(EXPORT_CSV.encode())
+        manager = GoogleContactExportManager(binary_io)
+        contacts = list(manager.get_contacts())
+        self.assertEqual(len(contacts), 1)
+        self.assertEqual(contacts[0].first_name, "JANE")
+        self.assertEqual(contacts[0].zip_code, "981011234")
+        # Reading again starts over, and leaves the file open.
+        self.assertEqual(len(list(manager.get_contacts())), 1)
+        self.assertFalse(binary_io.closed)
+
+    def test_get_contacts_from_path(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as temp:
+            temp.write(EXPORT_CSV)
+            temp.flush()
+            contacts = list(GoogleContactExportManager(temp.name).get_contacts())
+        self.assertEqual([contact.last_name for contact in contacts], ["DOE"])
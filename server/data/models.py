@@ -140,15 +140,23 @@ class Committee(BaseModel):
         statement = cls.for_name_stmt(name)
         return session.execute(statement).scalars()
 
+    @staticmethod
+    def adjust_party(committee_id: str, party: str | None) -> str | None:
+        """
+        Return a committee's FEC reported party, except in a few key cases,
+        where we know better.
+        """
+        if committee_id in KNOWN_DEM_COMMITTEE_IDS:
+            return Party.DEMOCRAT
+        return party
+
     @property
     def adjusted_party(self) -> str | None:
         """
         Return the FEC reported party, except in a few key cases,
         where we know better.
         """
-        if self.id in KNOWN_DEM_COMMITTEE_IDS:
-            return Party.DEMOCRAT
-        return self.party
+        return self.adjust_party(self.id, self.party)
 
     def to_data(self) -> dict[str, str | None]:
         """Return a dictionary representation of this committee."""
@@ -275,6 +283,91 @@ class Contribution(BaseModel):
         # print(str(statement), last_name, city, state, first_names)
         return session.execute(statement).scalars()
 
+    @classmethod
+    def for_last_zips_firsts_stmt(
+        cls, last_zip_firsts: t.Iterable[tuple[str, str, t.Iterable[str]]]
+    ):
+        """
+        Return a select statement for contributions matching *any* of the
+        given (last name, zip code, first names) criteria.
+
+        Criteria that share a (last name, zip5) pair are merged, so the
+        statement may over-match on first names; callers are expected to
+        bucket the results themselves. Each pair becomes its own term, which
+        SQLite answers with an index search; since SQLite caps expression
+        depth at 1,000, keep to a few hundred pairs per statement.
+
+        Names must already be upper-cased, as `Contact` stores them; batches
+        can run to thousands of names, so we don't normalize them again here.
+        """
+        last_zip_to_firsts: dict[tuple[str, str], set[str]] = {}
+        for last_name, zip_code, firsts in last_zip_firsts:
+            last_zip_to_firsts.setdefault((last_name, zip_code[:5]), set()).update(
+                firsts
+            )
+        return sa.select(cls).where(
+            sa.or_(
+                *(
+                    sa.and_(
+                        cls.last_name == last_name,
+                        cls.zip5 == zip5,
+                        cls.first_name.in_(sorted(firsts)),
+                    )
+                    for (last_name, zip5), firsts in sorted(last_zip_to_firsts.items())
+                )
+            )
+        )
+
+    @classmethod
+    def for_last_city_states_firsts_stmt(
+        cls, last_city_state_firsts: t.Iterable[tuple[str, str, str, t.Iterable[str]]]
+    ):
+        """
+        Return a select statement for contributions matching *any* of the
+        given (last name, city, state, first names) criteria.
+
+        As with `for_last_zips_firsts_stmt()`, criteria are merged per
+        (last name, city, state), each becomes its own indexed term, and
+        names must already be upper-cased.
+        """
+        last_city_state_to_firsts: dict[tuple[str, str, str], set[str]] = {}
+        for last_name, city, state, firsts in last_city_state_firsts:
+            last_city_state_to_firsts.setdefault(
+                (last_name, city.upper(), state.upper()), set()
+            ).update(firsts)
+        return sa.select(cls).where(
+            sa.or_(
+                *(
+                    sa.and_(
+                        cls.last_name == last_name,
+                        cls.city == city,
+                        cls.state == state,
+                        cls.first_name.in_(sorted(firsts)),
+                    )
+                    for (last_name, city, state), firsts in sorted(
+                        last_city_state_to_firsts.items()
+                    )
+                )
+            )
+        )
+
+    @classmethod
+    def grouped_by_committee_stmt(
+        cls, stmt: sa.Select, *keys: sa.ColumnElement
+    ) -> sa.Select:
+        """
+        Return a select statement that totals the positive contributions
+        matched by `stmt`, grouped by (any `keys`, then) committee ID.
+
+        Rows are (*keys, committee ID, cents). Committee details aren't joined
+        in; look them up by ID instead.
+        """
+        return (
+            sa.select(*keys, cls.committee_id, sa.func.sum(cls.amount_cents))
+            .where(stmt.whereclause, cls.amount_cents > 0)
+            .group_by(*keys, cls.committee_id)
+        )
+
     @classmethod
     def from_contribution_row(cls, row: t.Sequence[str]) -> t.Self | None:
         """Insert a contribution from a row of the contributions file."""
@@ -393,10 +486,16 @@ def validate_extant_db(data_manager: DataManager, state: str) -> None:
     validate_extant_file(path)
 
 
-def get_engine(data_manager: DataManager, state: str) -> sa.Engine:
-    """Return an engine for the given data manager."""
+def get_engine(data_manager: DataManager, state: str, pool_size: int = 5) -> sa.Engine:
+    """
+    Return an engine for the given data manager.
+
+    `pool_size` is the number of connections kept open for reuse; size it to
+    the number of threads that will query the engine at once.
+    """
     return sa.create_engine(
         f"sqlite:///{data_manager.path / 'db' / f'{state}.db'}",
+        pool_size=pool_size,
     )
 
 
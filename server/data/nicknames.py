@@ -1,4 +1,5 @@
 """Tools for working with nicknames."""
+import csv
 import pathlib
 import typing as t
 
@@ -12,23 +13,32 @@ def split_name(name: str) -> tuple[str, str]:
     if not name:
         raise ValueError("Name is empty")
 
-    splits = name.split(",")
-    if len(splits) == 1:
-        return splits[0].strip().upper(), ""
+    # This runs for every row of the contributions file, so use partition(),
+    # which stops at the first separator, rather than building split() lists.
+    last, comma, rest = name.partition(",")
+    if not comma:
+        return last.strip().upper(), ""
 
-    last = splits[0].strip().upper()
-    first = splits[1].strip().split(" ")[0].upper()
-    return last, first
+    first = rest.partition(",")[0].strip().partition(" ")[0].upper()
+    return last.strip().upper(), first
 
 
 class INamesProvider(t.Protocol):
     """A protocol for getting related names."""
 
     def get_related_names(self, name: str) -> t.Iterable[frozenset[str]]:
-        """Get the sets of related names for a given name."""
+        """
+        Get the sets of related names for a given name.
+
+        The name must already be upper-cased and stripped.
+        """
         ...
 
 
+_NO_RELATED_NAMES: frozenset[frozenset[str]] = frozenset()
+"""What `get_related_names()` returns for names it doesn't know."""
+
+
 class NicknamesManager:
     """
     Tools for working with a 'messy' nicknames file.
@@ -44,24 +54,33 @@ class NicknamesManager:
     _indexes_for_name: dict[str, frozenset[int]]
     """A dictionary mapping names to the indexes of the sets they appear in."""
 
+    _related_names_for_name: dict[str, frozenset[frozenset[str]]]
+    """Memoized results of `get_related_names()`."""
+
     def __init__(self, names: t.Iterable[t.Iterable[str]]):
-        self._related_names = tuple(
-            frozenset(name.upper().strip() for name in name_set) for name_set in names
-        )
-        mutable_indexes_for_name = {}
-        for i, name_set in enumerate(self._related_names):
-            for name in name_set:
-                mutable_indexes_for_name.setdefault(name, set()).add(i)
+        # Freeze and index each name set in a single pass.
+        related_names: list[frozenset[str]] = []
+        mutable_indexes_for_name: dict[str, list[int]] = {}
+        for i, name_set in enumerate(names):
+            frozen_name_set = frozenset(name.upper().strip() for name in name_set)
+            related_names.append(frozen_name_set)
+            for name in frozen_name_set:
+                mutable_indexes_for_name.setdefault(name, []).append(i)
+        self._related_names = tuple(related_names)
 
         self._indexes_for_name = {
             name: frozenset(indexes)
             for name, indexes in mutable_indexes_for_name.items()
         }
+        self._related_names_for_name = {}
 
     @classmethod
     def from_nicknames(cls, text_io: t.TextIO) -> t.Self:
         """Create a manager from a file-like object."""
-        return cls(frozenset(line.split(",")) for line in text_io if line.strip())
+        reader = csv.reader(text_io)
+        return cls(
+            frozenset(row) for row in reader if any(name.strip() for name in row)
+        )
 
     @classmethod
     def from_path(cls, path: str | pathlib.Path) -> t.Self:
@@ -76,8 +95,18 @@ class NicknamesManager:
         return cls.from_path(data_manager.path / "names" / "raw.txt")
 
     def get_related_names(self, name: str) -> t.Iterable[frozenset[str]]:
-        """Get the sets of related names for a given name."""
-        return frozenset(
-            self._related_names[index]
-            for index in self._indexes_for_name.get(name.upper().strip(), [])
-        )
+        """
+        Get the sets of related names for a given name.
+
+        The name must already be upper-cased and stripped.
+        """
+        # Every contact asks, and most names repeat; build each answer once.
+        # Only names in the file are memoized, so the memo stays bounded.
+        related_names = self._related_names_for_name.get(name)
+        if related_names is None:
+            indexes = self._indexes_for_name.get(name)
+            if indexes is None:
+                return _NO_RELATED_NAMES
+            related_names = frozenset(self._related_names[index] for index in indexes)
+            self._related_names_for_name[name] = related_names
+        return related_names
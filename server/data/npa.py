@@ -8,7 +8,7 @@ from server.utils.validations import get_str, validate_dict, validate_extant_fil
 from .manager import DataManager
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AreaCode:
     """A phone number area code aka NAMPA NPA_ID."""
 
@@ -51,19 +51,20 @@ class AreaCodeManager:
     """Tools for working with phone number area codes aka NAMPA NPA_IDs."""
 
     _area_codes: list[AreaCode]
-    _npa_id_to_area_codes: dict[str, frozenset[AreaCode]]
+    _npa_id_to_area_codes: dict[str, tuple[AreaCode, ...]]
 
     def __init__(self, area_codes: t.Iterable[AreaCode]):
         self._area_codes = list(area_codes)
 
-        # Index the area codes by NPA_ID.
-        unfrozen_npa_id_to_area_codes: dict[str, set[AreaCode]] = {}
+        # Index the area codes by NPA_ID. Callers only ever iterate each group,
+        # so tuples serve as well as sets and need no hashing to build.
+        unfrozen_npa_id_to_area_codes: dict[str, list[AreaCode]] = {}
         for area_code in self._area_codes:
-            unfrozen_npa_id_to_area_codes.setdefault(area_code.npa_id, set()).add(
+            unfrozen_npa_id_to_area_codes.setdefault(area_code.npa_id, []).append(
                 area_code
             )
         self._npa_id_to_area_codes = {
-            npa_id: frozenset(area_codes)
+            npa_id: tuple(area_codes)
             for npa_id, area_codes in unfrozen_npa_id_to_area_codes.items()
         }
 
@@ -79,7 +80,7 @@ class AreaCodeManager:
 
     def get_area_codes(self, npa_id: str) -> t.Iterable[AreaCode]:
         """Get all area codes for a given NPA_ID."""
-        return self._npa_id_to_area_codes.get(npa_id, [])
+        return self._npa_id_to_area_codes.get(npa_id, ())
 
     def get_city_states(self, npa_id: str) -> t.Iterable[tuple[str, str]]:
         """Get all city, state pairs for a given NPA_ID."""
@@ -1,5 +1,16 @@
+import functools
+import re
+
 import phonenumbers
 
+# Both public functions here are pure and memoized on their (trimmed) string
+# input; contact imports tend to see the same numbers over and over, and
+# phonenumbers' parse + validity checks are the expensive part.
+
+# Matches the overwhelmingly common case of a US number written with ten
+# digits, an optional leading (+)1, and the usual separators.
+_US_FAST = re.compile(r"^(?:\+?1)?[\s\-().]*(\d{3})[\s\-().]*(\d{3})[\s\-().]*(\d{4})$")
+
 
 def normalize_e164(phone_number: str) -> str | None:
     """
@@ -7,6 +18,15 @@ def normalize_e164(phone_number: str) -> str | None:
 
     Return None if this cannot be done.
     """
+    return _normalize_e164(phone_number.strip())
+
+
+@functools.lru_cache(maxsize=100_000)
+def _normalize_e164(phone_number: str) -> str | None:
+    """Normalize an already-trimmed phone number to E164 format."""
+    fast = _normalize_us_e164(phone_number)
+    if fast is not None:
+        return fast
     try:
         # Bias parsing towards US phone numbers since that's what we care about;
         # this will probably fail for non-US numbers in users' contact lists
@@ -22,6 +42,24 @@ def normalize_e164(phone_number: str) -> str | None:
         return None
 
 
+def _normalize_us_e164(phone_number: str) -> str | None:
+    """
+    Normalize an obviously-US phone number without invoking the full parser.
+
+    Return None if the number isn't obviously a valid US number; the caller
+    should then fall back to `phonenumbers.parse()`.
+    """
+    match = _US_FAST.match(phone_number)
+    if match is None:
+        return None
+    digits = "".join(match.groups())
+    number = phonenumbers.PhoneNumber(country_code=1, national_number=int(digits))
+    if not phonenumbers.is_valid_number(number):
+        return None
+    return f"+1{digits}"
+
+
+@functools.lru_cache(maxsize=100_000)
 def get_npa_id(e164: str) -> str | None:
     """
     Return the area code for an e164-formatted phone number.
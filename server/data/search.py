@@ -1,37 +1,86 @@
+import copy
+import os
+import threading
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 from server.data.contacts import Contact, IContactProvider
 from server.data.manager import DataManager
 from server.data.models import get_engine, is_extant_db
 from server.data.nicknames import NicknamesManager
 from server.data.summaries import (
+    SUMMARY_BATCH_SIZE,
+    CommitteeDetails,
     ContributionSummary,
     ContributionSummaryManager,
 )
 
 
+def default_max_workers() -> int:
+    """
+    Return a default worker count for searching.
+
+    Searching is dominated by waiting on SQL round-trips, not CPU, so we size
+    the pool well beyond the number of cores.
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
 class ContactContributionSearcher:
-    def __init__(self, data_manager: DataManager):
+    def __init__(self, data_manager: DataManager, max_workers: int | None = None):
         self._data_manager = data_manager
         self._nicknames_manager = NicknamesManager.from_data_manager(data_manager)
-        self._seen = set()
-        self._state_to_manager = {}
+        self._seen: set[str] = set()
+        self._state_to_manager: dict[str, ContributionSummaryManager | None] = {}
+        # Every state database holds the same committees, so share them.
+        self._committees: dict[str, CommitteeDetails | None] = {}
+        self._lock = threading.Lock()
+        self._max_workers = max_workers or default_max_workers()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="search"
+        )
+
+    def spawn(self) -> "ContactContributionSearcher":
+        """
+        Return a new searcher that shares this one's loaded data, but not its
+        seen variants.
+
+        Nicknames, per-state summary managers (with their engines and committee
+        names), and the thread pool are all shared; only what's been matched is
+        fresh.
+        Useful for long-lived processes that search independent contact lists.
+        """
+        searcher = copy.copy(self)
+        searcher._seen = set()
+        return searcher
 
     def _get_or_load_manager(self, state: str) -> ContributionSummaryManager | None:
         """Get or load a manager for a state."""
-        manager = self._state_to_manager.get(state)
-        if manager is None:
+        with self._lock:
+            # States without a database are remembered as `None`, so we only
+            # hit the filesystem once per state.
+            if state in self._state_to_manager:
+                return self._state_to_manager[state]
+            manager = None
             if is_extant_db(self._data_manager, state):
+                # Every worker in our pool may query the same state at once.
+                engine = get_engine(
+                    self._data_manager, state, pool_size=self._max_workers
+                )
                 manager = ContributionSummaryManager(
-                    get_engine(self._data_manager, state), self._nicknames_manager
+                    engine, self._nicknames_manager, committees=self._committees
                 )
-                self._state_to_manager[state] = manager
-        return manager
+            self._state_to_manager[state] = manager
+            return manager
 
     def search_and_summarize(self, contact: Contact) -> ContributionSummary | None:
         """Search for a contact and summarize their contributions."""
-        if contact.variant_id in self._seen:
-            return None
+        # Variant IDs are built by string formatting each time they're asked
+        # for, so ask once.
+        variant_id = contact.variant_id
+        with self._lock:
+            if variant_id in self._seen:
+                return None
         if not contact.state:
             return None
         manager = self._get_or_load_manager(contact.state)
@@ -39,44 +88,87 @@ class ContactContributionSearcher:
             return None
         summary = manager.preferred_summary_for_contact(contact)
         if summary is not None:
-            self._seen.add(contact.variant_id)
+            with self._lock:
+                self._seen.add(variant_id)
             return summary
         return None
 
+    def _claim(
+        self, contact: Contact, summary: ContributionSummary | None
+    ) -> ContributionSummary | None:
+        """Return `summary` unless the contact's variant has already matched."""
+        variant_id = contact.variant_id
+        with self._lock:
+            if variant_id in self._seen:
+                return None
+            if summary is not None:
+                self._seen.add(variant_id)
+            return summary
+
+    def _find_preferred_summaries(
+        self, contacts: t.Sequence[Contact]
+    ) -> dict[int, ContributionSummary | None]:
+        """
+        Find the preferred summary for each contact, keyed by its index.
+
+        Contacts are grouped by state, so that each state's manager can look up
+        its contacts in batched queries. Within a state we order by last name
+        and location, so relatives sharing a last name and zip code land in the
+        same batch and share a single query term. Batches are I/O bound, so we
+        run them all -- including several from one state -- on our thread pool.
+        """
+        state_to_indexes: dict[str, list[int]] = {}
+        for index, contact in enumerate(contacts):
+            if contact.state:
+                state_to_indexes.setdefault(contact.state, []).append(index)
+        futures = []
+        for state, indexes in state_to_indexes.items():
+            manager = self._get_or_load_manager(state)
+            if manager is None:
+                continue
+            indexes.sort(
+                key=lambda index: (
+                    contacts[index].last_name,
+                    contacts[index].zip5 or "",
+                    contacts[index].city or "",
+                )
+            )
+            for start in range(0, len(indexes), SUMMARY_BATCH_SIZE):
+                batch_indexes = indexes[start : start + SUMMARY_BATCH_SIZE]
+                future = self._executor.submit(
+                    manager.preferred_summaries_for_contacts,
+                    [contacts[index] for index in batch_indexes],
+                )
+                futures.append((batch_indexes, future))
+        found: dict[int, ContributionSummary | None] = {}
+        for indexes, future in futures:
+            found.update(zip(indexes, future.result(), strict=True))
+        return found
+
     def search_and_summarize_contacts(
         self, contacts: IContactProvider
     ) -> t.Iterable[tuple[Contact, ContributionSummary | None]]:
         """Search for contacts and summarize their contributions."""
+        contacts_list = list(contacts.get_contacts())
+        found = self._find_preferred_summaries(contacts_list)
+
         # Summarize all variants, but line them up with the same import ID.
-        import_id_to_summaries: dict[
-            str, list[tuple[Contact, ContributionSummary | None]]
-        ] = {}
-        for contact in contacts.get_contacts():
-            result = self.search_and_summarize(contact)
-            if result is not None:
-                import_id_to_summaries.setdefault(contact.import_id, []).append(
-                    (contact, result)
-                )
-            else:
-                import_id_to_summaries.setdefault(contact.import_id, []).append(
-                    (contact, None)
-                )
+        # Only the first match for a given variant counts, exactly as if we'd
+        # called `search_and_summarize()` on each contact in turn.
+        #
+        # For each import ID, we want the best summary. That's the one with the
+        # largest value *if* there is one; if they're all "None", then it's None,
+        # and it doesn't matter which contact we choose, since we're unmatched.
+        import_id_to_first: dict[str, Contact] = {}
+        import_id_to_best: dict[str, tuple[Contact, ContributionSummary]] = {}
+        for index, contact in enumerate(contacts_list):
+            import_id_to_first.setdefault(contact.import_id, contact)
+            result = self._claim(contact, found.get(index))
+            if result is None:
+                continue
+            best = import_id_to_best.get(contact.import_id)
+            if best is None or result.total_cents > best[1].total_cents:
+                import_id_to_best[contact.import_id] = (contact, result)
 
-        # For each import ID, pick the best summary. That's the one with the
-        # largest value *if* there is one; if they're all "None", then it's None.
-        for _, summary_tuples in import_id_to_summaries.items():
-            best_contact = None
-            best_summary = None
-            for contact, summary in summary_tuples:
-                if summary is None:
-                    continue
-                if best_summary is None:
-                    best_contact = contact
-                    best_summary = summary
-                elif summary.total_cents > best_summary.total_cents:
-                    best_contact = contact
-                    best_summary = summary
-            if best_contact is None:
-                # It doesn't matter which one we choose, since we're unmatched.
-                best_contact = summary_tuples[0][0]
-            yield best_contact, best_summary
+        for import_id, first_contact in import_id_to_first.items():
+            yield import_id_to_best.get(import_id, (first_contact, None))
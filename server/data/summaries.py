@@ -1,4 +1,7 @@
+import functools
+import itertools
 import typing as t
+from collections import defaultdict
 
 import sqlalchemy as sa
 import sqlalchemy.orm as sao
@@ -6,55 +9,127 @@ import sqlalchemy.orm as sao
 from server.utils.format import fmt_usd
 
 from .contacts import Contact
+from .fec_types import Party
 from .models import Committee, Contribution
 from .nicknames import INamesProvider
 
+CommitteeDetails = tuple[str, str | None]
+"""A committee's (name, adjusted party)."""
+
+_fmt_usd = functools.lru_cache(maxsize=4096)(fmt_usd)
+"""`fmt_usd()`, remembering recently formatted amounts."""
+
+SUMMARY_BATCH_SIZE = 250
+"""How many distinct contacts to look up per batch of SQL statements."""
+
 
 class ContributionSummary:
     """Provides a high-level summary of multiple contributions."""
 
-    _contributions: list[Contribution]
+    _contributions: list[Contribution] | None
+    _load_contributions: t.Callable[[], t.Iterable[Contribution]] | None
+    _total_cents: int
+    _by_committee: dict[str, int]
+    """Total cents, by committee ID."""
+    _committees: dict[str, CommitteeDetails]
+    """Committee details, by committee ID."""
+    _by_party: dict[str | None, int]
+    """Total cents, by adjusted party."""
 
     def __init__(self, contributions: t.Iterable[Contribution]):
-        self._contributions = [
-            contribution
-            for contribution in contributions
-            if contribution.amount_cents > 0
-        ]
+        # Aggregate everything in a single pass; every total is then a lookup.
+        self._contributions = []
+        self._load_contributions = None
+        self._total_cents = 0
+        self._by_committee = defaultdict(int)
+        self._committees = {}
+        self._by_party = defaultdict(int)
+        for contribution in contributions:
+            if contribution.amount_cents <= 0:
+                continue
+            self._contributions.append(contribution)
+            committee = contribution.committee
+            self._add(
+                committee.id,
+                (committee.name, committee.adjusted_party),
+                contribution.amount_cents,
+            )
+
+    @classmethod
+    def from_grouped_rows(
+        cls,
+        rows: t.Iterable[t.Sequence[t.Any]],
+        committees: t.Mapping[str, CommitteeDetails | None],
+        load_contributions: t.Callable[[], t.Iterable[Contribution]],
+    ) -> t.Self:
+        """
+        Create a summary from rows already totaled by committee in SQL.
+
+        Rows are (committee ID, cents), as returned by
+        `Contribution.grouped_by_committee_stmt()`; `committees` maps IDs to
+        committee details. Rows for unknown committees are skipped. The individual
+        contributions are only loaded, with `load_contributions`, if and when
+        someone asks for them.
+        """
+        summary = cls(())
+        summary._contributions = None
+        summary._load_contributions = load_contributions
+        for committee_id, amount_cents in rows:
+            details = committees.get(committee_id)
+            if details is not None:
+                summary._add(committee_id, details, amount_cents)
+        return summary
+
+    def _add(
+        self, committee_id: str, details: CommitteeDetails, amount_cents: int
+    ) -> None:
+        """Add a (positive) amount given to a committee to the totals."""
+        self._total_cents += amount_cents
+        self._by_committee[committee_id] += amount_cents
+        self._committees.setdefault(committee_id, details)
+        self._by_party[details[1]] += amount_cents
 
     @property
-    def contributions(self) -> t.Iterable[Contribution]:
+    def contributions(self) -> t.Sequence[Contribution]:
         """The contributions that make up the summary."""
+        if self._contributions is None:
+            assert self._load_contributions is not None
+            self._contributions = [
+                contribution
+                for contribution in self._load_contributions()
+                if contribution.amount_cents > 0
+            ]
         return self._contributions
 
     @property
     def total_cents(self) -> int:
         """The total amount of all contributions, in cents."""
-        return sum(contribution.amount_cents for contribution in self._contributions)
+        return self._total_cents
 
     @property
     def total_fmt(self) -> str:
         """The total amount of all contributions, formatted."""
-        return fmt_usd(self.total_cents)
+        return _fmt_usd(self.total_cents)
+
+    def _sorted_committees(self) -> list[tuple[str, CommitteeDetails]]:
+        """Return (committee ID, details) for each committee, by name."""
+        return sorted(self._committees.items(), key=lambda item: item[1][0])
 
     def committees(self) -> t.Iterable[Committee]:
         """Return the committees that received contributions."""
-        return sorted(
-            {contribution.committee for contribution in self._contributions},
-            key=lambda c: c.name,
-        )
+        # The party is already adjusted, and adjusting it again is a no-op.
+        return [
+            Committee(id=committee_id, name=name, party=party)
+            for committee_id, (name, party) in self._sorted_committees()
+        ]
 
     def committee_total_cents(self, committee: Committee) -> int:
         """Return the total amount of contributions for a committee."""
-        return sum(
-            contribution.amount_cents
-            for contribution in self._contributions
-            if contribution.committee == committee
-        )
+        return self._by_committee.get(committee.id, 0)
 
     def committee_total_fmt(self, committee: Committee) -> str:
         """Return the total amount of contributions for a committee, formatted."""
-        return fmt_usd(self.committee_total_cents(committee))
+        return _fmt_usd(self.committee_total_cents(committee))
 
     def committee_percent(self, committee: Committee) -> float:
         """Return the % of contributions for a committee."""
@@ -62,21 +137,11 @@ class ContributionSummary:
 
     def parties(self) -> t.Iterable[str | None]:
         """Return the parties that received contributions."""
-        return sorted(
-            {
-                contribution.committee.adjusted_party
-                for contribution in self._contributions
-            },
-            key=lambda p: p or "",
-        )
+        return sorted(self._by_party.keys(), key=lambda p: p or "")
 
     def party_total_cents(self, party: str | None) -> int:
         """Return the total amount of contributions for a party."""
-        return sum(
-            contribution.amount_cents
-            for contribution in self._contributions
-            if contribution.committee.adjusted_party == party
-        )
+        return self._by_party.get(party, 0)
 
     def party_total_cents_anything_but(self, parties: set[str]) -> int:
         """
@@ -84,42 +149,85 @@ class ContributionSummary:
         but the named parties.
         """
         return sum(
-            contribution.amount_cents
-            for contribution in self._contributions
-            if contribution.committee.adjusted_party not in parties
+            total_cents
+            for party, total_cents in self._by_party.items()
+            if party not in parties
         )
 
     def party_total_fmt(self, party: str | None) -> str:
         """Return the total amount of contributions for a party, formatted."""
-        return fmt_usd(self.party_total_cents(party))
+        return _fmt_usd(self.party_total_cents(party))
 
     def party_percent(self, party: str | None) -> float:
         """Return the % of contributions for a party."""
         return self.party_total_cents(party) / self.total_cents
 
+    def _party_code_totals(self) -> dict[str, int]:
+        """Return total cents by party code, counting no party as unknown."""
+        totals: dict[str, int] = defaultdict(int)
+        for party, total_cents in self._by_party.items():
+            totals[party or Party.UNKNOWN] += total_cents
+        return totals
+
+    def revised_party_totals(self) -> dict[str, int]:
+        """
+        Return total cents by party code, with the unknown party's total
+        distributed across the known parties, in proportion to their totals.
+
+        If no party is known, the unknown total is left as it is.
+        """
+        totals = self._party_code_totals()
+        unknown_cents = totals.pop(Party.UNKNOWN, 0)
+        known_cents = sum(totals.values())
+        if not known_cents:
+            return {Party.UNKNOWN: unknown_cents} if unknown_cents else {}
+        return {
+            party: round(total_cents * self._total_cents / known_cents)
+            for party, total_cents in totals.items()
+        }
+
     def to_data(self) -> dict:
         """Return a dict representation of the summary."""
+        # Look each total up once, and share formatted amounts: the same
+        # totals turn up again and again across summaries.
+        total_cents = self._total_cents
+        by_committee = self._by_committee
+        committees = {}
+        for committee_id, (name, party) in self._sorted_committees():
+            cents = by_committee[committee_id]
+            committees[committee_id] = {
+                "name": name,
+                "party": party,
+                "total_cents": cents,
+                "total_fmt": _fmt_usd(cents),
+                "percent": cents / total_cents,
+            }
+        parties = {}
+        for party, cents in sorted(self._party_code_totals().items()):
+            parties[party] = {
+                "total_cents": cents,
+                "total_fmt": _fmt_usd(cents),
+                "percent": cents / total_cents,
+            }
+        # Roll up what every client displays, once, here: parties with the
+        # unknown total distributed, and whichever of those got the most.
+        revised_parties = {}
+        top_party, top_cents = Party.UNKNOWN, 0
+        for party, cents in sorted(self.revised_party_totals().items()):
+            revised_parties[party] = {
+                "total_cents": cents,
+                "total_fmt": _fmt_usd(cents),
+                "percent": cents / total_cents,
+            }
+            if cents > top_cents:
+                top_party, top_cents = party, cents
         return {
-            "total_cents": self.total_cents,
-            "total_fmt": self.total_fmt,
-            "committees": {
-                committee.id: {
-                    "name": committee.name,
-                    "party": committee.adjusted_party,
-                    "total_cents": self.committee_total_cents(committee),
-                    "total_fmt": self.committee_total_fmt(committee),
-                    "percent": self.committee_percent(committee),
-                }
-                for committee in self.committees()
-            },
-            "parties": {
-                party: {
-                    "total_cents": self.party_total_cents(party),
-                    "total_fmt": self.party_total_fmt(party),
-                    "percent": self.party_percent(party),
-                }
-                for party in self.parties()
-            },
+            "total_cents": total_cents,
+            "total_fmt": _fmt_usd(total_cents),
+            "committees": committees,
+            "parties": parties,
+            "revised_parties": revised_parties,
+            "top_party": top_party,
         }
 
     def __str__(self) -> str:
@@ -149,14 +257,38 @@ class ContributionSummaryManager:
 
     _engine: sa.Engine
     _names_provider: INamesProvider
+    _committees: dict[str, CommitteeDetails | None]
+    """
+    Details of the committees we've looked up, by ID; `None` for IDs with no
+    committee. Every state database holds the same committees, so managers
+    may share this.
+    """
 
     def __init__(
         self,
         engine: sa.Engine,
         names_provider: INamesProvider,
+        committees: dict[str, CommitteeDetails | None] | None = None,
     ):
         self._engine = engine
         self._names_provider = names_provider
+        self._committees = {} if committees is None else committees
+
+    def _summary_key(self, contact: Contact) -> tuple:
+        """Return the fields that fully determine a contact's preferred summary."""
+        # A summary depends on the first name only through its related names,
+        # so nicknames that share the same related names (say, JON and JOHN)
+        # share a summary, too.
+        related_names = frozenset(
+            self._names_provider.get_related_names(contact.first_name)
+        )
+        return (
+            contact.last_name,
+            contact.zip5,
+            contact.city,
+            contact.state,
+            related_names or contact.first_name,
+        )
 
     def _contact_stmt(self, contact: Contact, related_name_set: frozenset[str]):
         """Return a SQL statement that matches a contact."""
@@ -174,22 +306,93 @@ class ContributionSummaryManager:
                 contact.last_name, contact.zip5, related_name_set
             )
 
-    def _summaries_for_contact(
-        self, contact: Contact
-    ) -> t.Iterable[ContributionSummary]:
-        """Return all possible contribution summaries for a contact."""
+    def _related_name_sets(self, contact: Contact) -> list[frozenset[str]]:
+        """Return the sets of first names we should search for a contact."""
         related_name_sets = list(
             self._names_provider.get_related_names(contact.first_name)
         )
         # No related names? Just use the first name.
         if not related_name_sets:
             related_name_sets = [frozenset([contact.first_name])]
+        return related_name_sets
+
+    def _get_committees(
+        self, committee_ids: t.Iterable[str]
+    ) -> t.Mapping[str, CommitteeDetails | None]:
+        """Return details for (at least) the given committees, by ID."""
+        # Summaries only ever name a handful of committees; look up just those,
+        # once each.
+        committees = self._committees
+        missing_ids = {cid for cid in committee_ids if cid not in committees}
+        if missing_ids:
+            stmt = sa.select(Committee.id, Committee.name, Committee.party).where(
+                Committee.id.in_(sorted(missing_ids))
+            )
+            with self._engine.connect() as connection:
+                for committee_id, name, party in connection.execute(stmt):
+                    committees[committee_id] = (
+                        name,
+                        Committee.adjust_party(committee_id, party),
+                    )
+            for committee_id in missing_ids:
+                committees.setdefault(committee_id, None)
+        return committees
+
+    def _contributions_for_contact(
+        self, contact: Contact, related_name_set: frozenset[str]
+    ) -> list[Contribution]:
+        """Load the contributions that match a contact."""
+        # Builds its statement on demand, since most summaries never call this.
         with sao.Session(self._engine) as session:
-            for related_name_set in related_name_sets:
-                stmt = self._contact_stmt(contact, related_name_set)
-                summary = ContributionSummary(session.execute(stmt).scalars().all())
-                if summary.total_cents > 0:
-                    yield summary
+            stmt = self._contact_stmt(contact, related_name_set)
+            return list(session.execute(stmt).scalars().all())
+
+    def _summaries_for_contact(
+        self, contact: Contact
+    ) -> t.Iterable[ContributionSummary]:
+        """
+        Return all possible contribution summaries for a contact.
+
+        Summaries are totaled by committee in SQL; their contributions are only
+        loaded if someone asks for them.
+        """
+        # Issue a single query across all of the related name sets, tagging each
+        # row with its first name, then split the rows back out by name set.
+        related_name_sets = self._related_name_sets(contact)
+        stmt = Contribution.grouped_by_committee_stmt(
+            self._contact_stmt(contact, frozenset().union(*related_name_sets)),
+            Contribution.first_name,
+        )
+        # These are plain Core selects, so skip the ORM session and its result
+        # processing altogether.
+        by_first_name: dict[str, list[tuple[str, int]]] = {}
+        committee_ids: set[str] = set()
+        with self._engine.connect() as connection:
+            for first_name, committee_id, cents in connection.execute(stmt):
+                by_first_name.setdefault(first_name, []).append((committee_id, cents))
+                committee_ids.add(committee_id)
+        committees = self._get_committees(committee_ids)
+        for related_name_set in related_name_sets:
+            summary = ContributionSummary.from_grouped_rows(
+                self._rows_for_names(by_first_name, related_name_set),
+                committees,
+                functools.partial(
+                    self._contributions_for_contact, contact, related_name_set
+                ),
+            )
+            if summary.total_cents > 0:
+                yield summary
+
+    @staticmethod
+    def _rows_for_names(
+        by_first_name: dict[str, list[tuple[str, int]]], names: frozenset[str]
+    ) -> t.Iterable[tuple[str, int]]:
+        """Return the (committee ID, cents) rows for any of a set of first names."""
+        # Rows are bucketed by first name up front, so each name set only
+        # touches its own rows, rather than rescanning every row.
+        return itertools.chain.from_iterable(
+            by_first_name.get(name, ()) for name in names
+        )
 
     def preferred_summary_for_contact(
         self, contact: Contact
@@ -199,9 +402,135 @@ class ContributionSummaryManager:
         try_contacts = [contact]
         if contact.has_zip:
             try_contacts.append(contact.without_zip())
-        summaries = []
+        # Keep a running best rather than collecting every candidate. Ties go
+        # to the earliest summary, as with `max()`.
+        best: ContributionSummary | None = None
         for try_contact in try_contacts:
-            summaries.extend(list(self._summaries_for_contact(try_contact)))
-        if not summaries:
-            return None
-        return max(summaries, key=lambda s: s.total_cents)
+            for summary in self._summaries_for_contact(try_contact):
+                if best is None or summary.total_cents > best.total_cents:
+                    best = summary
+        return best
+
+    def preferred_summaries_for_contacts(
+        self, contacts: t.Sequence[Contact], batch_size: int = SUMMARY_BATCH_SIZE
+    ) -> list[ContributionSummary | None]:
+        """
+        Return the largest contribution summary for each of many contacts.
+
+        This is equivalent to calling `preferred_summary_for_contact()` for each
+        contact, but issues a couple of SQL statements per batch of contacts
+        rather than several per contact. Results line up with `contacts`.
+        """
+        # Look up each distinct contact only once. Nothing is kept between
+        # calls: managers live as long as the process, and serve every upload.
+        found: dict[tuple, ContributionSummary | None] = {}
+        key_to_contact: dict[tuple, Contact] = {}
+        contact_keys = [self._summary_key(contact) for contact in contacts]
+        for contact, key in zip(contacts, contact_keys, strict=True):
+            key_to_contact.setdefault(key, contact)
+        keys = list(key_to_contact)
+        for start in range(0, len(keys), batch_size):
+            batch_keys = keys[start : start + batch_size]
+            found.update(
+                zip(
+                    batch_keys,
+                    self._preferred_summaries_for_batch(
+                        [key_to_contact[key] for key in batch_keys]
+                    ),
+                    strict=True,
+                )
+            )
+        return [found[key] for key in contact_keys]
+
+    def _preferred_summaries_for_batch(
+        self, contacts: t.Sequence[Contact]
+    ) -> list[ContributionSummary | None]:
+        """Return the largest contribution summary for each of a batch of contacts."""
+        for contact in contacts:
+            assert contact.has_city_state
+        name_sets = [self._related_name_sets(contact) for contact in contacts]
+
+        # Committee totals, per (last name, zip5) or (last name, city, state),
+        # then per first name, as (committee ID, cents) rows.
+        by_last_zip: dict[tuple, dict[str, list[tuple[str, int]]]] = {}
+        by_last_city_state: dict[tuple, dict[str, list[tuple[str, int]]]] = {}
+        committee_ids: set[str] = set()
+        with self._engine.connect() as connection:
+            last_zip_firsts = [
+                (contact.last_name, contact.zip5, frozenset().union(*sets))
+                for contact, sets in zip(contacts, name_sets, strict=True)
+                if contact.zip5 is not None
+            ]
+            if last_zip_firsts:
+                stmt = Contribution.grouped_by_committee_stmt(
+                    Contribution.for_last_zips_firsts_stmt(last_zip_firsts),
+                    Contribution.last_name,
+                    Contribution.zip5,
+                    Contribution.first_name,
+                )
+                for last_name, zip5, first_name, *row in connection.execute(stmt):
+                    by_last_zip.setdefault((last_name, zip5), {}).setdefault(
+                        first_name, []
+                    ).append(tuple(row))
+                    committee_ids.add(row[0])
+            last_city_state_firsts = [
+                (
+                    contact.last_name,
+                    t.cast(str, contact.city),
+                    t.cast(str, contact.state),
+                    frozenset().union(*sets),
+                )
+                for contact, sets in zip(contacts, name_sets, strict=True)
+            ]
+            stmt = Contribution.grouped_by_committee_stmt(
+                Contribution.for_last_city_states_firsts_stmt(last_city_state_firsts),
+                Contribution.last_name,
+                Contribution.city,
+                Contribution.state,
+                Contribution.first_name,
+            )
+            for last_name, city, state, first_name, *row in connection.execute(stmt):
+                by_last_city_state.setdefault((last_name, city, state), {}).setdefault(
+                    first_name, []
+                ).append(tuple(row))
+                committee_ids.add(row[0])
+
+        committees = self._get_committees(committee_ids)
+        results: list[ContributionSummary | None] = []
+        for contact, sets in zip(contacts, name_sets, strict=True):
+            # Mirror `preferred_summary_for_contact()`: try the zip code (if any),
+            # then the city and state, for every related name set.
+            candidates: list[tuple[Contact, dict[str, list[tuple[str, int]]]]] = []
+            if contact.zip5 is not None:
+                candidates.append(
+                    (contact, by_last_zip.get((contact.last_name, contact.zip5), {}))
+                )
+            candidates.append(
+                (
+                    contact.without_zip(),
+                    by_last_city_state.get(
+                        (
+                            contact.last_name,
+                            t.cast(str, contact.city).upper(),
+                            t.cast(str, contact.state).upper(),
+                        ),
+                        {},
+                    ),
+                )
+            )
+            best: ContributionSummary | None = None
+            for try_contact, by_first_name in candidates:
+                for name_set in sets:
+                    summary = ContributionSummary.from_grouped_rows(
+                        self._rows_for_names(by_first_name, name_set),
+                        committees,
+                        functools.partial(
+                            self._contributions_for_contact, try_contact, name_set
+                        ),
+                    )
+                    if summary.total_cents > 0 and (
+                        best is None or summary.total_cents > best.total_cents
+                    ):
+                        best = summary
+            results.append(best)
+        return results
@@ -1,4 +1,5 @@
 # ruff: noqa: D102
+import io
 import unittest
 
 from . import nicknames as nn
@@ -23,3 +24,49 @@ class SplitNameTestCase(unittest.TestCase):
 
     def test_messy_spacing(self):
         self.assertEqual(nn.split_name("  Smith ,  John  "), ("SMITH", "JOHN"))
+
+    def test_extra_commas(self):
+        self.assertEqual(nn.split_name("Smith, John, Jr."), ("SMITH", "JOHN"))
+        self.assertEqual(nn.split_name("Smith,"), ("SMITH", ""))
+
+
+class NicknamesManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.manager = nn.NicknamesManager(
+            [["John", "Jack", "Jon"], ["Jack", "Jackson"], [" Bob ", "Robert"]]
+        )
+
+    def test_related_names(self):
+        self.assertEqual(
+            set(self.manager.get_related_names("JOHN")),
+            {frozenset({"JOHN", "JACK", "JON"})},
+        )
+
+    def test_related_names_multiple_sets(self):
+        self.assertEqual(
+            set(self.manager.get_related_names("JACK")),
+            {frozenset({"JOHN", "JACK", "JON"}), frozenset({"JACK", "JACKSON"})},
+        )
+
+    def test_related_names_normalized(self):
+        self.assertEqual(
+            set(self.manager.get_related_names("BOB")),
+            {frozenset({"BOB", "ROBERT"})},
+        )
+
+    def test_related_names_unknown(self):
+        self.assertEqual(set(self.manager.get_related_names("ZED")), set())
+        self.assertNotIn("ZED", self.manager._related_names_for_name)
+
+    def test_from_nicknames(self):
+        manager = nn.NicknamesManager.from_nicknames(
+            io.StringIO("John,Jack,Jon\n\n  \nBob,Robert\n")
+        )
+        self.assertEqual(
+            set(manager.get_related_names("JON")),
+            {frozenset({"JOHN", "JACK", "JON"})},
+        )
+        self.assertEqual(
+            set(manager.get_related_names("ROBERT")),
+            {frozenset({"BOB", "ROBERT"})},
+        )
@@ -0,0 +1,35 @@
+# ruff: noqa: D102
+import unittest
+
+from . import phone as p
+
+
+class NormalizeE164TestCase(unittest.TestCase):
+    def test_ten_digits(self):
+        self.assertEqual(p.normalize_e164("2065551234"), "+12065551234")
+
+    def test_punctuated(self):
+        self.assertEqual(p.normalize_e164("(206) 555-1234"), "+12065551234")
+
+    def test_leading_one(self):
+        self.assertEqual(p.normalize_e164("1-206-555-1234"), "+12065551234")
+
+    def test_already_e164(self):
+        self.assertEqual(p.normalize_e164(" +12065551234 "), "+12065551234")
+
+    def test_invalid_us(self):
+        self.assertIsNone(p.normalize_e164("0005551234"))
+
+    def test_garbage(self):
+        self.assertIsNone(p.normalize_e164("not a phone"))
+
+    def test_non_us(self):
+        self.assertEqual(p.normalize_e164("+44 20 7946 0958"), "+442079460958")
+
+
+class GetNpaIdTestCase(unittest.TestCase):
+    def test_us(self):
+        self.assertEqual(p.get_npa_id("+12065551234"), "206")
+
+    def test_non_us(self):
+        self.assertIsNone(p.get_npa_id("+442079460958"))
@@ -0,0 +1,105 @@
+# ruff: noqa: D102
+import csv
+import pathlib
+import tempfile
+import typing as t
+from unittest import TestCase, mock
+
+from .contacts import Contact, SimpleContactProvider
+from .manager import DataManager
+from .models import get_engine
+from .search import ContactContributionSearcher
+from .summaries import ContributionSummary
+from .test_summaries import NICKNAMES, contact, populate, summary_data
+
+
+def search_one_by_one(
+    searcher: ContactContributionSearcher, contacts: t.Iterable[Contact]
+) -> t.Iterable[tuple[Contact, ContributionSummary | None]]:
+    """Search contacts in turn, keeping the best summary for each import ID."""
+    import_id_to_summaries: dict[
+        str, list[tuple[Contact, ContributionSummary | None]]
+    ] = {}
+    for c in contacts:
+        import_id_to_summaries.setdefault(c.import_id, []).append(
+            (c, searcher.search_and_summarize(c))
+        )
+    for summary_tuples in import_id_to_summaries.values():
+        best_contact, best_summary = summary_tuples[0][0], None
+        for c, summary in summary_tuples:
+            if summary is not None and (
+                best_summary is None or summary.total_cents > best_summary.total_cents
+            ):
+                best_contact, best_summary = c, summary
+        yield best_contact, best_summary
+
+
+class SearchAndSummarizeContactsTestCase(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        path = pathlib.Path(self.temp_dir.name)
+        (path / "names").mkdir()
+        with (path / "names" / "raw.txt").open("w", newline="") as names_file:
+            csv.writer(names_file).writerows(NICKNAMES)
+        (path / "db").mkdir()
+        self.data_manager = DataManager(path)
+        engine = get_engine(self.data_manager, "WA")
+        populate(engine)
+        engine.dispose()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_matches_one_by_one(self):
+        self.assert_matches_one_by_one()
+
+    def test_matches_one_by_one_in_small_batches(self):
+        # Several batches from one state run at once on the pool.
+        with mock.patch("server.data.search.SUMMARY_BATCH_SIZE", 2):
+            self.assert_matches_one_by_one()
+
+    def assert_matches_one_by_one(self):
+        contacts = [
+            # Two variants of one contact, with the same summary.
+            contact("JOHN", "SMITH", "SEATTLE", "98101", import_id="a"),
+            contact("JON", "SMITH", "SEATTLE", "98101", import_id="a"),
+            # The same variant twice: only the first match counts.
+            contact("JOHN", "SMITH", "SEATTLE", "98101", import_id="b"),
+            contact("JOHN", "SMITH", "SEATTLE", "98101", import_id="b"),
+            # Variants with different summaries; the largest wins.
+            contact("WILL", "SMITH", "TACOMA", "98402", import_id="c"),
+            contact("BILLY", "SMITH", "TACOMA", import_id="c"),
+            contact("MARY", "JONES", "SEATTLE", "98103", import_id="d"),
+            contact("PAT", "BROWN", "SEATTLE", "98101", import_id="e"),
+            # A state with no database.
+            Contact(
+                import_id="f",
+                first_name="JOHN",
+                last_name="SMITH",
+                city="PORTLAND",
+                state="OR",
+                phone=None,
+                zip_code=None,
+            ),
+        ]
+        expected = [
+            (c, summary_data(summary))
+            for c, summary in search_one_by_one(
+                ContactContributionSearcher(self.data_manager, max_workers=2),
+                contacts,
+            )
+        ]
+        searcher = ContactContributionSearcher(self.data_manager, max_workers=2)
+        self.assertEqual(
+            [
+                (c, summary_data(summary))
+                for c, summary in searcher.search_and_summarize_contacts(
+                    SimpleContactProvider(contacts)
+                )
+            ],
+            expected,
+        )
+        self.assertEqual([c.import_id for c, _ in expected], list("abcdef"))
+        self.assertEqual(expected[2][0].first_name, "BILLY")
+        self.assertIsNone(expected[3][1])
+        self.assertIsNone(expected[5][1])
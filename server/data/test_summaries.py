@@ -0,0 +1,282 @@
+# ruff: noqa: D102
+import datetime
+from unittest import TestCase
+
+import sqlalchemy as sa
+import sqlalchemy.orm as sao
+
+from .contacts import Contact
+from .fec_types import Party
+from .models import Committee, Contribution, create_db_tables
+from .nicknames import NicknamesManager
+from .summaries import ContributionSummary, ContributionSummaryManager
+
+COMMITTEES = {
+    "C1": Committee(id="C1", name="DEM ONE", party=Party.DEMOCRAT),
+    "C2": Committee(id="C2", name="REP ONE", party=Party.REPUBLICAN),
+    "C3": Committee(id="C3", name="NOBODY", party=None),
+    "C4": Committee(id="C4", name="UNKNOWN", party=Party.UNKNOWN),
+}
+
+
+def summarize(*rows: tuple[str, int]) -> ContributionSummary:
+    committees = {cid: (c.name, c.adjusted_party) for cid, c in COMMITTEES.items()}
+    return ContributionSummary.from_grouped_rows(rows, committees, lambda: ())
+
+
+class ContributionSummaryToDataTestCase(TestCase):
+    def test_no_party_is_unknown(self):
+        data = summarize(("C1", 100), ("C3", 100), ("C4", 200)).to_data()
+        self.assertEqual(list(data["parties"]), [Party.DEMOCRAT, Party.UNKNOWN])
+        self.assertEqual(data["parties"][Party.UNKNOWN]["total_cents"], 300)
+
+    def test_revised_parties_distribute_unknown(self):
+        data = summarize(("C1", 300), ("C2", 100), ("C3", 400)).to_data()
+        revised = data["revised_parties"]
+        self.assertEqual(list(revised), [Party.DEMOCRAT, Party.REPUBLICAN])
+        self.assertEqual(revised[Party.DEMOCRAT]["total_cents"], 600)
+        self.assertEqual(revised[Party.DEMOCRAT]["total_fmt"], "$6")
+        self.assertEqual(revised[Party.DEMOCRAT]["percent"], 0.75)
+        self.assertEqual(revised[Party.REPUBLICAN]["total_cents"], 200)
+        self.assertEqual(data["top_party"], Party.DEMOCRAT)
+
+    def test_revised_parties_only_unknown(self):
+        data = summarize(("C3", 100)).to_data()
+        self.assertEqual(list(data["revised_parties"]), [Party.UNKNOWN])
+        self.assertEqual(data["revised_parties"][Party.UNKNOWN]["percent"], 1)
+        self.assertEqual(data["top_party"], Party.UNKNOWN)
+
+    def test_top_party_tie_goes_to_first(self):
+        data = summarize(("C1", 100), ("C2", 100)).to_data()
+        self.assertEqual(data["top_party"], Party.DEMOCRAT)
+
+
+NICKNAMES = [["JOHN", "JON", "JOHNNY"], ["WILLIAM", "BILL", "WILL"], ["BILL", "BILLY"]]
+
+# (committee ID, last name, first name, city, zip code, cents); all in WA.
+CONTRIBUTIONS = [
+    ("C1", "SMITH", "JOHN", "SEATTLE", "981011234", 1000),
+    ("C2", "SMITH", "JON", "SEATTLE", "98101", 500),
+    ("C1", "SMITH", "JOHNNY", "SEATTLE", "98102", 700),
+    ("C2", "SMITH", "WILLIAM", "TACOMA", "98402", 300),
+    ("C1", "SMITH", "BILL", "TACOMA", "98402", 200),
+    ("C3", "SMITH", "BILLY", "TACOMA", "98402", 900),
+    ("C1", "JONES", "MARY", "SEATTLE", "98103", 0),
+    ("C2", "JONES", "MARY", "SEATTLE", "98103", -500),
+    ("C1", "JONES", "ANNE", "SPOKANE", "99201", 2500),
+    ("C1", "JONES", "ANNE", "SPOKANE", "99201", -2500),
+    ("C2", "BROWN", "PAT", "SEATTLE", "98101", 100),
+]
+
+
+def populate(engine: sa.Engine) -> None:
+    """Create the tables and fill them with the test committees and contributions."""
+    create_db_tables(engine)
+    with sao.Session(engine) as session:
+        session.add_all(
+            Committee(id=committee.id, name=committee.name, party=committee.party)
+            for committee in COMMITTEES.values()
+        )
+        session.add_all(
+            Contribution(
+                id=str(i),
+                dt=datetime.date(2020, 1, 1),
+                committee_id=committee_id,
+                last_name=last_name,
+                first_name=first_name,
+                city=city,
+                state="WA",
+                zip5=zip_code[:5],
+                zip_code=zip_code,
+                employer="",
+                occupation="",
+                amount_cents=cents,
+            )
+            for i, (committee_id, last_name, first_name, city, zip_code, cents) in (
+                enumerate(CONTRIBUTIONS)
+            )
+        )
+        session.commit()
+
+
+def contact(
+    first_name: str,
+    last_name: str,
+    city: str,
+    zip_code: str | None = None,
+    import_id: str = "1",
+) -> Contact:
+    return Contact(
+        import_id=import_id,
+        first_name=first_name,
+        last_name=last_name,
+        city=city,
+        state="WA",
+        phone=None,
+        zip_code=zip_code,
+    )
+
+
+def summary_data(summary: ContributionSummary | None) -> tuple | None:
+    """Return everything about a summary that we expect to match."""
+    if summary is None:
+        return None
+    return summary.to_data(), sorted(c.id for c in summary.contributions)
+
+
+class BatchQueryPlanTestCase(TestCase):
+    def setUp(self):
+        self.engine = sa.create_engine("sqlite://")
+        create_db_tables(self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def query_plan(self, stmt: sa.Select) -> list[str]:
+        sql = str(stmt.compile(self.engine, compile_kwargs={"literal_binds": True}))
+        with self.engine.connect() as connection:
+            return [
+                row[-1]
+                for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")
+            ]
+
+    def assert_searches_index(self, stmt: sa.Select, index: str):
+        plan = self.query_plan(stmt)
+        self.assertFalse([step for step in plan if step.startswith("SCAN")], plan)
+        self.assertIn(f"SEARCH contributions USING INDEX {index}", " ".join(plan))
+
+    def test_last_zips_firsts(self):
+        stmt = Contribution.grouped_by_committee_stmt(
+            Contribution.for_last_zips_firsts_stmt(
+                [("SMITH", "98101", ["JOHN", "JON"]), ("JONES", "98103", ["MARY"])]
+            ),
+            Contribution.last_name,
+            Contribution.zip5,
+            Contribution.first_name,
+        )
+        self.assert_searches_index(stmt, "last_name_zip5_first_name")
+
+    def test_last_city_states_firsts(self):
+        stmt = Contribution.grouped_by_committee_stmt(
+            Contribution.for_last_city_states_firsts_stmt(
+                [
+                    ("SMITH", "SEATTLE", "WA", ["JOHN", "JON"]),
+                    ("JONES", "Spokane", "WA", ["ANNE"]),
+                ]
+            ),
+            Contribution.last_name,
+            Contribution.city,
+            Contribution.state,
+            Contribution.first_name,
+        )
+        self.assert_searches_index(stmt, "last_name_city_state_first_name")
+
+
+class PreferredSummariesForContactsTestCase(TestCase):
+    def setUp(self):
+        self.engine = sa.create_engine(
+            "sqlite://",
+            poolclass=sa.pool.StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        populate(self.engine)
+        self.nicknames = NicknamesManager(NICKNAMES)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def assert_matches_one_by_one(self, contacts: list[Contact]):
+        # Separate managers, so neither answers from the other's cache.
+        batched = ContributionSummaryManager(self.engine, self.nicknames)
+        single = ContributionSummaryManager(self.engine, self.nicknames)
+        expected = [
+            summary_data(single.preferred_summary_for_contact(c)) for c in contacts
+        ]
+        self.assertEqual(
+            [
+                summary_data(summary)
+                for summary in batched.preferred_summaries_for_contacts(
+                    contacts, batch_size=2
+                )
+            ],
+            expected,
+        )
+        return expected
+
+    def test_zip(self):
+        expected = self.assert_matches_one_by_one(
+            [contact("JOHN", "SMITH", "SEATTLE", "98101")]
+        )
+        # The city's total beats the zip code's.
+        self.assertEqual(expected[0][0]["total_cents"], 2200)
+
+    def test_zip_plus_four(self):
+        self.assert_matches_one_by_one(
+            [contact("JOHN", "SMITH", "SEATTLE", "981011234")]
+        )
+
+    def test_no_zip(self):
+        expected = self.assert_matches_one_by_one(
+            [contact("JOHN", "SMITH", "Seattle"), contact("ANNE", "JONES", "SPOKANE")]
+        )
+        self.assertEqual(expected[0][0]["total_cents"], 2200)
+        self.assertEqual(expected[1][0]["total_cents"], 2500)
+
+    def test_mismatched_city(self):
+        expected = self.assert_matches_one_by_one(
+            [
+                contact("JOHN", "SMITH", "TACOMA", "98101"),
+                contact("JOHN", "SMITH", "SEATTLE", "98402"),
+            ]
+        )
+        self.assertEqual(expected[0][0]["total_cents"], 1500)
+        self.assertEqual(expected[1][0]["total_cents"], 2200)
+
+    def test_nickname_sets(self):
+        expected = self.assert_matches_one_by_one(
+            [
+                contact("BILL", "SMITH", "TACOMA"),
+                contact("WILL", "SMITH", "tacoma", "98402"),
+                contact("BILLY", "SMITH", "TACOMA"),
+                contact("PAT", "BROWN", "SEATTLE", "98101"),
+            ]
+        )
+        self.assertEqual(expected[0][0]["total_cents"], 1100)
+        self.assertEqual(expected[1][0]["total_cents"], 500)
+
+    def test_non_positive_amounts(self):
+        expected = self.assert_matches_one_by_one(
+            [
+                contact("MARY", "JONES", "SEATTLE", "98103"),
+                contact("NOBODY", "SMITH", "SEATTLE", "98101"),
+            ]
+        )
+        self.assertEqual(expected, [None, None])
+
+    def test_many_batches_with_repeats(self):
+        contacts = [
+            contact("JOHN", "SMITH", "SEATTLE", "98101"),
+            contact("JON", "SMITH", "SEATTLE", "98101"),
+            contact("BILL", "SMITH", "TACOMA"),
+            contact("MARY", "JONES", "SEATTLE", "98103"),
+            contact("JOHN", "SMITH", "SEATTLE", "98101"),
+            contact("ANNE", "JONES", "SPOKANE", "99201"),
+            contact("BILL", "SMITH", "TACOMA"),
+        ]
+        self.assert_matches_one_by_one(contacts)
+
+    def test_looks_up_only_matched_committees(self):
+        committees = {}
+        manager = ContributionSummaryManager(
+            self.engine, self.nicknames, committees=committees
+        )
+        summary = manager.preferred_summary_for_contact(
+            contact("PAT", "BROWN", "SEATTLE", "98101")
+        )
+        assert summary is not None
+        self.assertEqual(committees, {"C2": ("REP ONE", Party.REPUBLICAN)})
+        self.assertEqual([c.id for c in summary.committees()], ["C2"])
+        manager.preferred_summaries_for_contacts(
+            [contact("BILL", "SMITH", "TACOMA"), contact("JOHN", "SMITH", "SEATTLE")]
+        )
+        self.assertEqual(set(committees), {"C1", "C2", "C3"})
@@ -0,0 +1,47 @@
+# ruff: noqa: D102
+import io
+import unittest
+
+from . import usps as u
+
+ZIPS_CSV = """\
+DELIVERY ZIPCODE,PHYSICAL CITY,PHYSICAL STATE
+98101,Seattle,WA
+98101-1234,Seattle ,WA
+98004,Bellevue,WA
+98004,Clyde Hill,WA
+
+"""
+
+
+class ZipCodeManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.manager = u.ZipCodeManager.from_csv_io(io.StringIO(ZIPS_CSV))
+
+    def test_details(self):
+        self.assertEqual(
+            sorted(self.manager.details, key=lambda d: (d.zip5, d.city)),
+            [
+                u.ZipCodeDetail(zip5="98004", city="BELLEVUE", state="WA"),
+                u.ZipCodeDetail(zip5="98004", city="CLYDE HILL", state="WA"),
+                u.ZipCodeDetail(zip5="98101", city="SEATTLE", state="WA"),
+            ],
+        )
+
+    def test_get_details(self):
+        self.assertEqual(
+            list(self.manager.get_details("981011234")),
+            [u.ZipCodeDetail(zip5="98101", city="SEATTLE", state="WA")],
+        )
+
+    def test_get_details_invalid(self):
+        self.assertEqual(list(self.manager.get_details("981")), [])
+
+    def test_get_city_states(self):
+        self.assertEqual(
+            list(self.manager.get_city_states("98004")),
+            [("BELLEVUE", "WA"), ("CLYDE HILL", "WA")],
+        )
+
+    def test_get_city_states_unknown(self):
+        self.assertEqual(list(self.manager.get_city_states("00000")), [])
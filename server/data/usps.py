@@ -1,5 +1,6 @@
 import csv
 import pathlib
+import sys
 import typing as t
 from dataclasses import dataclass
 
@@ -107,21 +108,12 @@ STATES = {
 }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ZipCodeDetail:
     zip5: str
     city: str
     state: str
 
-    @classmethod
-    def from_zip_code_row(cls, row: dict[str, str]) -> t.Self:
-        """Create a zip code from a row of the zip code file."""
-        return cls(
-            zip5=row["DELIVERY ZIPCODE"][:5],  # XXX used to be PHYSICAL ZIP
-            city=row["PHYSICAL CITY"].strip().upper(),
-            state=row["PHYSICAL STATE"].strip().upper(),
-        )
-
 
 class IZipCodeProvider(t.Protocol):
     """Interface for zip code providers."""
@@ -136,40 +128,105 @@ class IZipCodeProvider(t.Protocol):
 
 
 class ZipCodeManager:
-    """Tools for managing zip code data."""
+    """
+    Tools for managing zip code data.
+
+    Details are stored column-wise, as parallel lists of zip5s and (city, state)
+    codes, rather than as one object per row. `ZipCodeDetail`s are only built
+    when asked for.
+    """
+
+    _zip5s: list[str]
+    _city_state_codes: list[int]
+    """Per row, an index into `_city_states`."""
+    _city_states: list[tuple[str, str]]
+    """Each distinct (city, state) pair, once."""
+    _city_state_to_code: dict[tuple[str, str], int]
+    _zip5_to_rows: dict[str, tuple[int, ...]]
+    """Indexes into the columns, by zip5."""
+    _zip5_to_city_states: dict[str, tuple[tuple[str, str], ...]]
+    """Memoized results of `get_city_states()`."""
 
-    _details: list[ZipCodeDetail]
-    _zip5_to_details: dict[str, frozenset[ZipCodeDetail]]
+    def __init__(self, details: t.Iterable[ZipCodeDetail] = ()):
+        self._zip5s = []
+        self._city_state_codes = []
+        self._city_states = []
+        self._city_state_to_code = {}
+        self._zip5_to_rows = {}
+        self._zip5_to_city_states = {}
+        self._extend(
+            (detail.zip5, self._encode(detail.city, detail.state)) for detail in details
+        )
+
+    def _encode(self, city: str, state: str) -> int:
+        """Return the code for a (city, state) pair, assigning one if needed."""
+        # Most rows repeat a (city, state) pair seen before; once encoded as a
+        # small integer, comparing rows no longer touches strings.
+        city_state = (city, state)
+        code = self._city_state_to_code.get(city_state)
+        if code is None:
+            code = self._city_state_to_code[city_state] = len(self._city_states)
+            self._city_states.append(city_state)
+        return code
 
-    def __init__(self, details: t.Iterable[ZipCodeDetail]):
-        self._details = list(details)
+    def _extend(self, entries: t.Iterable[tuple[str, int]]) -> None:
+        """Add (zip5, city/state code) entries to the columns and index, deduped."""
+        # This runs once per row of the USPS file, so keep everything it
+        # touches in locals rather than paying for attribute lookups per row.
+        zip5s, codes = self._zip5s, self._city_state_codes
+        zip5_to_rows = self._zip5_to_rows
+        for zip5, code in entries:
+            # Deduplicate against the zip5's own rows -- rarely more than a
+            # handful -- so that deduplication and indexing share a single
+            # pass. Rows are kept as tuples: they're only ever iterated once
+            # loaded, and with so few per zip5, re-tupling on append is cheap.
+            rows = zip5_to_rows.get(zip5, ())
+            for row in rows:
+                if codes[row] == code:
+                    break
+            else:
+                zip5_to_rows[zip5] = (*rows, len(zip5s))
+                zip5s.append(zip5)
+                codes.append(code)
 
-        # Index the zip codes by zip5
-        unfrozen_zip5_to_details = {}
-        for detail in self._details:
-            unfrozen_zip5_to_details.setdefault(detail.zip5, set()).add(detail)
-        self._zip5_to_details = {
-            zip5: frozenset(details)
-            for zip5, details in unfrozen_zip5_to_details.items()
-        }
+    def _detail(self, row: int) -> ZipCodeDetail:
+        """Build the zip code detail for a row."""
+        city, state = self._city_states[self._city_state_codes[row]]
+        return ZipCodeDetail(zip5=self._zip5s[row], city=city, state=state)
 
     @property
-    def details(self) -> t.Iterable[ZipCodeDetail]:
+    def details(self) -> t.Sequence[ZipCodeDetail]:
         """Return all zip codes."""
-        return self.details
+        return [self._detail(row) for row in range(len(self._zip5s))]
 
     def get_details(self, zip_code: str) -> t.Iterable[ZipCodeDetail]:
         """Return all zip code details for a zip code."""
         if len(zip_code) not in (5, 9):
-            return frozenset()
-        return sorted(
-            self._zip5_to_details.get(zip_code[:5], frozenset()),
-            key=lambda detail: detail.city,
+            return ()
+        return tuple(
+            sorted(
+                (self._detail(row) for row in self._zip5_to_rows.get(zip_code[:5], ())),
+                key=lambda detail: detail.city,
+            )
         )
 
     def get_city_states(self, zip_code: str) -> t.Iterable[tuple[str, str]]:
         """Return all city, state pairs for a zip code."""
-        return ((detail.city, detail.state) for detail in self.get_details(zip_code))
+        if len(zip_code) not in (5, 9):
+            return ()
+        # Bulk contact imports ask about the same zip codes over and over.
+        zip5 = zip_code[:5]
+        city_states = self._zip5_to_city_states.get(zip5)
+        if city_states is None:
+            # Go straight to the columns, rather than building details to discard.
+            city_states = tuple(
+                sorted(
+                    self._city_states[self._city_state_codes[row]]
+                    for row in self._zip5_to_rows.get(zip5, ())
+                )
+            )
+            self._zip5_to_city_states[zip5] = city_states
+        return city_states
 
     @classmethod
     def from_csv_io(
@@ -177,9 +234,36 @@ class ZipCodeManager:
         text_io: t.TextIO,
     ) -> t.Self:
         """Create zip codes from a zip code file."""
-        reader = csv.DictReader(text_io)
-        details = {ZipCodeDetail.from_zip_code_row(row) for row in reader}
-        return cls(details)
+        # Look up column positions once, rather than building a dict per row.
+        reader = csv.reader(text_io)
+        header = next(reader, None)
+        manager = cls()
+        if header is None:
+            return manager
+        zip_index = header.index("DELIVERY ZIPCODE")  # XXX used to be PHYSICAL ZIP
+        city_index = header.index("PHYSICAL CITY")
+        state_index = header.index("PHYSICAL STATE")
+        # There are only tens of thousands of distinct (city, state) pairs
+        # across hundreds of thousands of rows. Normalize and encode each
+        # distinct raw pair once, sharing one string per distinct value; after
+        # that, a row's pair is a single lookup.
+        raw_to_code: dict[tuple[str, str], int] = {}
+
+        def entries() -> t.Iterator[tuple[str, int]]:
+            for row in reader:
+                if not row:
+                    continue
+                raw = (row[city_index], row[state_index])
+                code = raw_to_code.get(raw)
+                if code is None:
+                    code = raw_to_code[raw] = manager._encode(
+                        sys.intern(raw[0].strip().upper()),
+                        sys.intern(raw[1].strip().upper()),
+                    )
+                yield row[zip_index][:5], code
+
+        manager._extend(entries())
+        return manager
 
     @classmethod
     def from_path(
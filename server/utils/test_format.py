@@ -0,0 +1,19 @@
+# ruff: noqa: D102
+from unittest import TestCase
+
+from .format import fmt_usd
+
+
+class FmtUsdTestCase(TestCase):
+    def test_zero(self):
+        self.assertEqual(fmt_usd(0), "$0")
+
+    def test_whole_dollars(self):
+        self.assertEqual(fmt_usd(123456789), "$1,234,568")
+
+    def test_rounds_half_to_even(self):
+        self.assertEqual(fmt_usd(150), "$2")
+        self.assertEqual(fmt_usd(250), "$2")
+
+    def test_large_exact(self):
+        self.assertEqual(fmt_usd(2**53), "$90,071,992,547,410")
@@ -187,3 +187,29 @@ class FileValidationTestCase(TestCase):
             temp_path = pathlib.Path(temp_dir)
             with self.assertRaises(v.ValidationError):
                 v.validate_extant_file(temp_path)
+
+
+class NotExtantValidationTestCase(TestCase):
+    def test_is_not_extant_true(self):
+        temp_path = pathlib.Path("/tmp/does_not_exist" + str(id(self)))
+        self.assertTrue(v.is_not_extant(temp_path))
+
+    def test_is_not_extant_false(self):
+        with tempfile.NamedTemporaryFile() as temp_file:
+            self.assertFalse(v.is_not_extant(pathlib.Path(temp_file.name)))
+
+    def test_validate_not_extant_raises(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with self.assertRaises(v.ValidationError):
+                v.validate_not_extant(pathlib.Path(temp_dir))
+
+    def test_validate_or_create_dir_creates(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = pathlib.Path(temp_dir) / "a" / "b"
+            self.assertEqual(v.validate_or_create_dir(temp_path), temp_path.resolve())
+            self.assertTrue(v.is_extant_dir(temp_path))
+
+    def test_validate_or_create_dir_raises_actually_a_file(self):
+        with tempfile.NamedTemporaryFile() as temp_file:
+            with self.assertRaises(v.ValidationError):
+                v.validate_or_create_dir(pathlib.Path(temp_file.name))
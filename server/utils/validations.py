@@ -1,4 +1,5 @@
 import pathlib
+import stat
 import typing as t
 from decimal import Decimal
 
@@ -66,15 +67,19 @@ def validate_dict(value: object) -> dict:
 # Dict content validations
 #
 
+_MISSING = object()
+"""Stands in for a missing key, so a getter needs only one dict lookup."""
+
 
 def get_str(d: dict, key: str) -> str:
     """
     Return the value for `key` in `d` if it is a string,
     otherwise raise an exception.
     """
-    if key not in d:
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
         raise ValidationError(f"Key '{key}' not found in {d}")
-    return validate_str(d[key])
+    return validate_str(value)
 
 
 def get_optional_str(d: dict, key: str) -> str | None:
@@ -82,9 +87,10 @@ def get_optional_str(d: dict, key: str) -> str | None:
     Return the value for `key` in `d` if it is a string,
     otherwise raise an exception.
     """
-    if key not in d:
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
         return None
-    return validate_str(d[key])
+    return validate_str(value)
 
 
 def get_str_or_none(d: dict, key: str) -> str | None:
@@ -92,9 +98,10 @@ def get_str_or_none(d: dict, key: str) -> str | None:
     Return the value for `key` in `d` if it is a string or None,
     otherwise raise an exception.
     """
-    if key not in d:
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
         raise ValidationError(f"Key '{key}' not found in {d}")
-    return validate_str_or_none(d[key])
+    return validate_str_or_none(value)
 
 
 def get_convert_decimal(d: dict, key: str) -> Decimal:
@@ -102,9 +109,10 @@ def get_convert_decimal(d: dict, key: str) -> Decimal:
     Return the value for `key` in `d` if it is a string or decimal,
     otherwise raise an exception.
     """
-    if key not in d:
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
         raise ValidationError(f"Key '{key}' not found in {d}")
-    return validate_convert_decimal(d[key])
+    return validate_convert_decimal(value)
 
 
 def get_dict(d: dict, key: str) -> dict:
@@ -112,9 +120,10 @@ def get_dict(d: dict, key: str) -> dict:
     Return the value for `key` in `d` if it is a `dict`, otherwise
     raise an exception.
     """
-    if key not in d:
+    value = d.get(key, _MISSING)
+    if value is _MISSING:
         raise ValidationError(f"Key '{key}' not found in {d}")
-    return validate_dict(d[key])
+    return validate_dict(value)
 
 
 #
@@ -122,48 +131,58 @@ def get_dict(d: dict, key: str) -> dict:
 #
 
 
+def _stat_mode(path: pathlib.Path) -> int | None:
+    """Return the mode of whatever is at `path`, or None if nothing is there."""
+    # A single stat() answers "does it exist?" and "what is it?" together.
+    try:
+        return path.stat().st_mode
+    except (OSError, ValueError):
+        return None
+
+
 def is_extant_dir(path: pathlib.Path) -> bool:
     """Return True if the path exists and is a directory."""
-    path = path.resolve()
-    return path.exists() and path.is_dir()
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISDIR(mode)
 
 
 def validate_extant_dir(path: pathlib.Path) -> pathlib.Path:
     """Ensure `path` exists and is a directory."""
     path = path.resolve()
-    if not path.exists():
+    mode = _stat_mode(path)
+    if mode is None:
         raise ValidationError(f"Path does not exist: {path}")
-    if not path.is_dir():
+    if not stat.S_ISDIR(mode):
         raise ValidationError(f"Path is not a directory: {path}")
     return path
 
 
 def is_extant_file(path: pathlib.Path) -> bool:
     """Return True if the path exists and is a file."""
-    path = path.resolve()
-    return path.exists() and path.is_file()
+    mode = _stat_mode(path)
+    return mode is not None and stat.S_ISREG(mode)
 
 
 def validate_extant_file(path: pathlib.Path) -> pathlib.Path:
     """Ensure `path` exists and is a file."""
     path = path.resolve()
-    if not path.exists():
+    mode = _stat_mode(path)
+    if mode is None:
         raise ValidationError(f"Path does not exist: {path}")
-    if not path.is_file():
+    if not stat.S_ISREG(mode):
         raise ValidationError(f"Path is not a file: {path}")
     return path
 
 
 def is_not_extant(path: pathlib.Path) -> bool:
     """Return True if the path does not exist."""
-    path = path.resolve()
-    return not path.exists()
+    return _stat_mode(path) is None
 
 
 def validate_not_extant(path: pathlib.Path) -> pathlib.Path:
     """Ensure `path` does not exist."""
     path = path.resolve()
-    if path.exists():
+    if _stat_mode(path) is not None:
         raise ValidationError(f"Path already exists: {path}")
     return path
 
@@ -171,8 +190,9 @@ def validate_not_extant(path: pathlib.Path) -> pathlib.Path:
 def validate_or_create_dir(path: pathlib.Path) -> pathlib.Path:
     """Ensure `path` exists and is a directory, creating it if necessary."""
     path = path.resolve()
-    if not path.exists():
+    mode = _stat_mode(path)
+    if mode is None:
         path.mkdir(parents=True)
-    elif not path.is_dir():
+    elif not stat.S_ISDIR(mode):
         raise ValidationError(f"Path is not a directory: {path}")
     return path
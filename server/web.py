@@ -1,17 +1,46 @@
-import pathlib
-import tempfile
+import functools
+import hashlib
+import threading
 import typing as t
+from collections import OrderedDict
 
 from litestar import Litestar, get, post
 from litestar.datastructures import UploadFile
 from litestar.enums import RequestEncodingType
 from litestar.params import Body
 
+from server.data.contacts import IContactProvider
 from server.data.contacts.abbu import ZipABBUManager
 from server.data.contacts.google import GoogleContactExportManager
 from server.data.manager import DataManager
 from server.data.search import ContactContributionSearcher
 
+CONTACT_MANAGER_CLASSES: dict[str, t.Callable[[t.IO[bytes]], IContactProvider]] = {
+    "application/zip": ZipABBUManager,
+    "text/csv": GoogleContactExportManager,
+}
+"""The contact file types we accept, by content type."""
+
+SEARCH_CACHE_SIZE = 16
+"""How many recent search responses to keep, by upload content."""
+
+_search_cache: OrderedDict[tuple[str, bytes], dict] = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+@functools.cache
+def _get_searcher() -> ContactContributionSearcher:
+    """Return the searcher shared by all requests, built on first use."""
+    return ContactContributionSearcher(DataManager.default())
+
+
+def _upload_digest(file: t.IO[bytes]) -> bytes:
+    """Return a digest of an upload's content, leaving it rewound."""
+    file.seek(0)
+    digest = hashlib.file_digest(file, "blake2b").digest()
+    file.seek(0)
+    return digest
+
 
 @get("/")
 async def frontend_root() -> dict:
@@ -19,51 +48,70 @@ async def frontend_root() -> dict:
     return {"file": "index.html"}
 
 
+@functools.lru_cache(maxsize=1024)
+def _frontend_file(path: str) -> str:
+    """Return the file to serve for a frontend path."""
+    # A suffix, as pathlib sees it: a dot inside the final component.
+    path = path.rstrip("/")
+    name = path[path.rfind("/") + 1 :]
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return path
+    return f"{path}/index.html"
+
+
 @get("/{path:path}")
-async def frontend(path: pathlib.Path) -> dict:
+async def frontend(path: str) -> dict:
     """Return the index."""
-    if path.suffix == "":
-        path = path / "index.html"
-    return {"file": str(path)}
+    return {"file": _frontend_file(path)}
 
 
-@post("/api/search")
-async def search(
+# Searching blocks on SQL, so Litestar runs this on its worker threads.
+@post("/api/search", sync_to_thread=True)
+def search(
     data: t.Annotated[UploadFile, Body(media_type=RequestEncodingType.MULTI_PART)]
 ) -> dict:
     """Search a collection of contacts and summarize them."""
-    is_zip = data.content_type == "application/zip"
-    is_csv = data.content_type == "text/csv"
-    if not (is_zip or is_csv):
+    contact_manager_class = CONTACT_MANAGER_CLASSES.get(data.content_type)
+    if contact_manager_class is None:
         return {
             "ok": False,
             "message": "Invalid file type.",
             "code": "invalid_file_type",
         }
-    content = await data.read()
-    # Write to a temporary file; then pass it to the ZipABBUManager.
-    # Be sure to clean up the temporary file when we're done.
-    with tempfile.NamedTemporaryFile() as temp:
-        temp.write(content)
-        temp.flush()
-        data_manager = DataManager.default()
-        contact_manager = (
-            ZipABBUManager(temp.name)
-            if is_zip
-            else GoogleContactExportManager(temp.name)
-        )
-        searcher = ContactContributionSearcher(data_manager)
-        results = list(searcher.search_and_summarize_contacts(contact_manager))
-        return {
-            "ok": True,
-            "results": [
-                {
-                    "contact": result[0].to_data(),
-                    "summary": result[1].to_data() if result[1] else None,
-                }
-                for result in results
-            ],
-        }
+    # Repeat uploads of the same file are answered from the cache.
+    key = (data.content_type, _upload_digest(data.file))
+    with _search_cache_lock:
+        response = _search_cache.get(key)
+        if response is not None:
+            _search_cache.move_to_end(key)
+            return response
+    # Read contacts straight from the upload Litestar has already spooled.
+    contact_manager = contact_manager_class(data.file)
+    searcher = _get_searcher().spawn()
+    response = {
+        "ok": True,
+        "results": [
+            {
+                "contact": contact.to_data(),
+                "summary": summary.to_data() if summary else None,
+            }
+            for contact, summary in searcher.search_and_summarize_contacts(
+                contact_manager
+            )
+        ],
+    }
+    with _search_cache_lock:
+        _search_cache[key] = response
+        while len(_search_cache) > SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+    return response
+
+
+def _warm_searcher() -> None:
+    """Load the shared searcher before the app starts taking requests."""
+    # Otherwise the first search after a deploy pays for all of it.
+    _get_searcher()
 
 
-app = Litestar([search, frontend, frontend_root])
+app = Litestar([search, frontend, frontend_root], on_startup=[_warm_searcher])
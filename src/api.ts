@@ -30,6 +30,10 @@ export interface ContributionSummary {
   total_fmt: string;
   committees: Record<string, CommitteeSummary>;
   parties: Record<string, PartySummary>;
+  /** Parties, with the UNK party's total distributed across the others. */
+  revised_parties: Record<string, PartySummary>;
+  /** The party with the largest share of `revised_parties`. */
+  top_party: string;
 }
 
 /** A single search result. */